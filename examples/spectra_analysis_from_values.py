@@ -0,0 +1,41 @@
+from spectrum_plotter import (
+    add_analysis_annotations,
+    analyse_spectra,
+    plot_spectrum_from_values,
+)
+import numpy as np
+
+# energy bin edges in eV
+x = np.logspace(-5, 7.3, 710)
+rng = np.random.default_rng(1)
+dt_bin = np.searchsorted(x, 14.1e6) - 1
+
+spectrum = {}
+for cell in range(1, 101):
+    y = rng.random(709) * 0.1 + 1
+    y[dt_bin] = 20 / cell
+    spectrum[f"cell {cell}"] = (x, y)
+
+# all the spectra are analysed at once
+analysis = analyse_spectra(spectrum, threshold_energy=0.1e6)
+
+for key in ["cell 1", "cell 100"]:
+    print(key, analysis[key])
+
+test_plot = plot_spectrum_from_values(
+    spectrum={"cell 1": spectrum["cell 1"]},
+    x_label="Energy [eV]",
+    y_label="Flux [n/cm^2s]",
+    x_scale="log",
+    y_scale="log",
+    title="example plot with peaks marked",
+    plotting_package="plotly",
+)
+
+test_plot = add_analysis_annotations(
+    figure=test_plot,
+    analysis={"cell 1": analysis["cell 1"]},
+    plotting_package="plotly",
+)
+
+test_plot.write_html("example_spectra_analysis_plotly.html")
@@ -0,0 +1,21 @@
+from spectrum_plotter import run_dashboard
+import numpy as np
+
+# 709 group style energy bin edges with many spectra to browse
+x = np.logspace(-5, 7.3, 710)
+rng = np.random.default_rng(1)
+
+spectrum = {}
+for cell in range(1, 201):
+    y = rng.random(709) * cell
+    spectrum[f"cell {cell}"] = (x, y, y * 0.1)
+
+# requires uvicorn (pip install uvicorn), open http://127.0.0.1:8050 to browse
+run_dashboard(
+    spectrum=spectrum,
+    x_label="Energy [eV]",
+    y_label="Flux [n/cm^2s]",
+    x_scale="log",
+    y_scale="log",
+    max_points=500,
+)
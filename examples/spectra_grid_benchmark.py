@@ -0,0 +1,44 @@
+"""Compares the time taken to plot many spectra as panels of a single grid
+figure with the time taken to produce a separate figure for each spectrum."""
+
+import time
+
+from spectrum_plotter import plot_spectrum_from_values, plot_spectrum_grid_from_values
+import numpy as np
+
+number_of_spectra = 24
+x = np.logspace(0, 7, 710)
+rng = np.random.default_rng(1)
+
+spectrum = {}
+for cell in range(number_of_spectra):
+    y = rng.random(710)
+    y_err = y * 0.1
+    spectrum[f"cell {cell}"] = (x, y, y_err)
+
+for plotting_package, suffix in [("matplotlib", "png"), ("plotly", "html")]:
+
+    start = time.perf_counter()
+    for key, value in spectrum.items():
+        plot_spectrum_from_values(
+            spectrum={key: value},
+            x_scale="log",
+            plotting_package=plotting_package,
+            filename=f"benchmark_{key.replace(' ', '_')}.{suffix}",
+        )
+    separate_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    plot_spectrum_grid_from_values(
+        spectrum=spectrum,
+        x_scale="log",
+        columns=6,
+        plotting_package=plotting_package,
+        filename=f"benchmark_grid.{suffix}",
+    )
+    grid_time = time.perf_counter() - start
+
+    print(f"{plotting_package}: {number_of_spectra} spectra")
+    print(f"    separate figures {separate_time:.2f}s")
+    print(f"    single grid figure {grid_time:.2f}s")
+    print(f"    speed up {separate_time / grid_time:.1f}x")
@@ -0,0 +1,22 @@
+from spectrum_plotter import plot_spectrum_grid_from_values
+import numpy as np
+
+x = np.array([1, 2, 3, 4, 5, 6])
+
+# one panel is drawn for each spectrum in the dictionary
+spectrum_with_error = {}
+for cell in range(1, 7):
+    y = np.array([0, 1, 1, 0.5, 0.4, 3]) * cell
+    y_err = y * 0.1
+    spectrum_with_error[f"cell {cell}"] = (x, y, y_err)
+
+test_plot = plot_spectrum_grid_from_values(
+    spectrum=spectrum_with_error,
+    x_label="Energy [MeV]",
+    y_label="Flux [n/cm^2s]",
+    x_scale="linear",
+    y_scale="linear",
+    title="example grid plot",
+    columns=3,
+    filename="example_spectra_grid_matplotlib.png",
+)
@@ -0,0 +1,23 @@
+from spectrum_plotter import plot_spectrum_from_values, save_plots_as_html_bundle
+import numpy as np
+
+x = np.array([1, 2, 3, 4, 5, 6])
+
+figures = {}
+for cell in range(1, 11):
+    y = np.array([0, 1, 1, 0.5, 0.4, 3]) * cell
+    y_err = y * 0.1
+
+    # html_plotlyjs="directory" writes plotly.min.js once and each html file
+    # references it instead of embedding a copy of plotly.js
+    figures[f"cell {cell}"] = plot_spectrum_from_values(
+        spectrum={f"cell {cell}": (x, y, y_err)},
+        x_label="Energy [MeV]",
+        y_label="Flux [n/cm^2s]",
+        plotting_package="plotly",
+        filename=f"example_spectra_plotly_cell_{cell}.html",
+        html_plotlyjs="directory",
+    )
+
+# packs all the figures into one html page, each is drawn when scrolled to
+save_plots_as_html_bundle(figures=figures, filename="example_spectra_bundle.html")
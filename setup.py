@@ -38,5 +38,6 @@ setuptools.setup(
         "plotly",
         "openmc_tally_unit_converter",
         # "kaleido"  # required to save static images with plotly
+        # "uvicorn"  # required to serve the dashboard with run_dashboard
     ],
 )
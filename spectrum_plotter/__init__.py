@@ -1,2 +1,12 @@
 from .core import plot_spectrum_from_tally
 from .core import plot_spectrum_from_values
+from .core import plot_spectrum_grid_from_tally
+from .core import plot_spectrum_grid_from_values
+from .core import save_plots_as_html_bundle
+from .spectrum import Spectrum
+from .spectrum import SpectrumSet
+from .dashboard import create_dashboard_app
+from .dashboard import decimate_spectrum
+from .dashboard import run_dashboard
+from .analysis import add_analysis_annotations
+from .analysis import analyse_spectra
@@ -0,0 +1,417 @@
+from typing import Dict, List, Optional, Union
+
+import numpy as np
+from matplotlib.figure import Figure
+from numpy import ndarray
+
+from .spectrum import SpectrumSet, to_spectrum
+
+# energies in eV of characteristic peaks found in fusion neutron and photon
+# spectra which are checked for by default
+CHARACTERISTIC_PEAKS = {
+    "DT": 14.1e6,
+    "DD": 2.45e6,
+    "H capture": 2.223e6,
+    "annihilation": 0.511e6,
+}
+
+# the number of eV in each of the supported energy units
+ENERGY_UNITS_IN_EV = {
+    "eV": 1.0,
+    "electron_volt": 1.0,
+    "keV": 1e3,
+    "kiloelectron_volt": 1e3,
+    "MeV": 1e6,
+    "megaelectron_volt": 1e6,
+    "GeV": 1e9,
+    "gigaelectron_volt": 1e9,
+}
+
+
+class EnergyGrid:
+    """The quantities used in spectrum analysis that only depend on the
+    energy grid, found once for each group of spectra sharing the grid.
+
+    Arguments:
+        energy: the energy bin starts or energy bin edges.
+        number_of_bins: the number of energy bins in the grid.
+    """
+
+    __slots__ = ("bin_starts", "bin_edges", "bin_midpoints")
+
+    def __init__(self, energy: ndarray, number_of_bins: int):
+        energy = np.asarray(energy, dtype=np.float64)
+        if len(energy) == number_of_bins + 1 or number_of_bins == 0:
+            bin_edges = energy[: number_of_bins + 1]
+        elif number_of_bins == 1:
+            # a single bin start has no known width
+            bin_edges = np.append(energy, energy[-1])
+        else:
+            # the width of the last bin is unknown so the previous one is used
+            bin_edges = np.append(energy, 2 * energy[-1] - energy[-2])
+
+        self.bin_edges = bin_edges
+        self.bin_starts = bin_edges[:-1]
+        self.bin_midpoints = 0.5 * (bin_edges[:-1] + bin_edges[1:])
+
+
+def get_energy_conversion(energy_units: Optional[str]) -> float:
+    """Returns the number of eV in the energy units. Spectra without energy
+    units are assumed to be in eV"""
+
+    if energy_units is None:
+        return 1.0
+    if energy_units not in ENERGY_UNITS_IN_EV:
+        msg = (
+            f'energy_units of "{energy_units}" are not supported by '
+            f"analyse_spectra. Options are {list(ENERGY_UNITS_IN_EV)}"
+        )
+        raise ValueError(msg)
+    return ENERGY_UNITS_IN_EV[energy_units]
+
+
+def group_by_energy_grid(spectrum: Union[dict, SpectrumSet]) -> List[List[tuple]]:
+    """Groups the spectra into lists of (title, Spectrum) pairs that share an
+    energy grid and energy units. Spectra made from the same energy array are
+    matched by identity and other arrays are compared to one spectrum from
+    each existing group, so the energy values are never hashed"""
+
+    groups = []
+    groups_by_identity = {}
+
+    for key, value in spectrum.items():
+        value = to_spectrum(value)
+        identity = (
+            value.energy.__array_interface__["data"][0],
+            len(value.energy),
+            len(value.values),
+            value.energy_units,
+        )
+
+        group = groups_by_identity.get(identity)
+        if group is None:
+            for existing in groups:
+                first = existing[0][1]
+                if (
+                    len(first.values) == len(value.values)
+                    and first.energy_units == value.energy_units
+                    and np.array_equal(first.energy, value.energy)
+                ):
+                    group = existing
+                    break
+            else:
+                group = []
+                groups.append(group)
+            groups_by_identity[identity] = group
+
+        group.append((key, value))
+
+    return groups
+
+
+def analyse_spectra(
+    spectrum: Union[dict, SpectrumSet],
+    threshold_energy: float = 0.1e6,
+    peaks: Optional[Dict[str, float]] = None,
+    peak_ratio: float = 2.0,
+    peak_window: int = 3,
+) -> Dict[str, dict]:
+    """Summarises many spectra at once. Spectra that share an energy grid are
+    stacked into a single array so each quantity is calculated for all of
+    them in one numpy operation.
+
+    Arguments:
+        spectrum: A dictionary where the key is the spectrum title and the
+            dictionary values are Spectrum objects or tuples containing x, y
+            and optionally y_error values. A SpectrumSet can be passed in
+            place of the dictionary. The energy_units of Spectrum objects are
+            used to convert the threshold and peak energies, spectra without
+            energy_units are assumed to be in eV.
+        threshold_energy: the energy in eV above which the fraction of the
+            total is found. Defaults to 0.1 MeV.
+        peaks: A dictionary where the key is the peak name and the value is
+            the energy of the peak in eV. Defaults to CHARACTERISTIC_PEAKS.
+        peak_ratio: a peak is found when the value of the energy bin that
+            contains the peak energy is at least this many times the median of
+            the neighbouring energy bins.
+        peak_window: the number of energy bins either side of the peak energy
+            bin used to find the median of the neighbouring energy bins.
+
+    Returns:
+        A dictionary where the key is the spectrum title and the value is a
+        dictionary containing the "total", the "fraction_above_threshold",
+        the "mean_energy", the "threshold_energy" and the "peaks" found as a
+        dictionary of peak names and energies. Energies are in the
+        "energy_units" of the spectrum which are also included.
+    """
+
+    if peaks is None:
+        peaks = CHARACTERISTIC_PEAKS
+
+    results = {}
+    for members in group_by_energy_grid(spectrum):
+        first = members[0][1]
+        energy_units = first.energy_units or "eV"
+        conversion = get_energy_conversion(first.energy_units)
+        group_threshold_energy = threshold_energy / conversion
+        group_peaks = {name: energy / conversion for name, energy in peaks.items()}
+
+        energy_grid = EnergyGrid(first.energy, len(first))
+        values = np.stack([value.values for _, value in members])
+
+        cumulative = np.cumsum(values, axis=1)
+        total = values.sum(axis=1)
+
+        threshold_index = np.searchsorted(
+            energy_grid.bin_starts, group_threshold_energy, side="left"
+        )
+        if threshold_index > 0:
+            below_threshold = cumulative[:, threshold_index - 1]
+        else:
+            below_threshold = 0.0
+
+        # spectra with a total of zero give nan rather than raising
+        with np.errstate(divide="ignore", invalid="ignore"):
+            fraction_above_threshold = (total - below_threshold) / total
+            mean_energy = values @ energy_grid.bin_midpoints / total
+
+        peaks_found = find_peaks(
+            values, energy_grid, group_peaks, peak_ratio, peak_window
+        )
+
+        for index, (key, _) in enumerate(members):
+            results[key] = {
+                "total": float(total[index]),
+                "fraction_above_threshold": float(fraction_above_threshold[index]),
+                "mean_energy": float(mean_energy[index]),
+                "threshold_energy": group_threshold_energy,
+                "energy_units": energy_units,
+                "peaks": {
+                    name: group_peaks[name]
+                    for name, found in peaks_found.items()
+                    if found[index]
+                },
+            }
+
+    # returned in the same order as the spectra were provided
+    return {key: results[key] for key in spectrum.keys()}
+
+
+def find_peaks(
+    values: ndarray,
+    energy_grid: EnergyGrid,
+    peaks: Dict[str, float],
+    peak_ratio: float,
+    peak_window: int,
+) -> Dict[str, ndarray]:
+    """Checks a 2D array of spectra values, one spectrum per row, for each of
+    the peaks. Returns a dictionary of peak names and boolean arrays which are
+    True for the spectra where the peak was found"""
+
+    number_of_bins = values.shape[1]
+    peaks_found = {}
+
+    for name, energy in peaks.items():
+        index = np.searchsorted(energy_grid.bin_edges, energy, side="right") - 1
+        if index < 0 or index >= number_of_bins:
+            peaks_found[name] = np.zeros(len(values), dtype=bool)
+            continue
+
+        neighbours = np.r_[
+            max(index - peak_window, 0) : index,
+            index + 1 : min(index + peak_window + 1, number_of_bins),
+        ]
+        if len(neighbours) == 0:
+            peaks_found[name] = np.zeros(len(values), dtype=bool)
+            continue
+
+        background = np.median(values[:, neighbours], axis=1)
+        peak_values = values[:, index]
+        peaks_found[name] = (peak_values > 0) & (peak_values >= peak_ratio * background)
+
+    return peaks_found
+
+
+def format_analysis_summary(key: str, result: dict) -> List[str]:
+    """Returns the lines summarising the analysis of a spectrum"""
+
+    units = result["energy_units"]
+    return [
+        key,
+        f"total {result['total']:.3g}",
+        f"above {result['threshold_energy']:.3g} {units} "
+        f"{result['fraction_above_threshold']:.1%}",
+        f"mean energy {result['mean_energy']:.3g} {units}",
+    ]
+
+
+def add_analysis_annotations(
+    figure,
+    analysis: Dict[str, dict],
+    plotting_package: str,
+):
+    """Marks the peaks found by analyse_spectra on the matplotlib or plotly
+    graph object with a vertical dashed line and the peak name, and writes
+    the total, fraction above the threshold energy and mean energy of each
+    spectrum in the top left corner. Each peak is only marked once on each
+    set of axes even if it is found in several spectra. Grid figures from
+    plot_spectrum_grid_from_values are annotated panel by panel.
+
+    Arguments:
+        figure: the matplotlib.pyplot, matplotlib axes, matplotlib figure or
+            plotly.graph_objects object returned by the plotting functions.
+        analysis: the dictionary returned by analyse_spectra.
+        plotting_package: the name of the python package used to produce the
+            figure. Options are 'matplotlib' or 'plotly'
+
+    Returns:
+        the matplotlib.pyplot, matplotlib or plotly.graph_objects object
+    """
+
+    if plotting_package == "matplotlib":
+
+        if isinstance(figure, Figure):
+            # grid figures have a panel for each spectrum titled by its key
+            panels = [
+                (axis, {axis.get_title(): analysis[axis.get_title()]})
+                for axis in figure.axes
+                if axis.get_title() in analysis
+            ]
+        elif hasattr(figure, "gca"):
+            # matplotlib.pyplot is passed by plot_spectrum_from_values
+            panels = [(figure.gca(), analysis)]
+        else:
+            panels = [(figure, analysis)]
+
+        for axis, panel_analysis in panels:
+            add_matplotlib_analysis_annotations(axis, panel_analysis)
+
+        return figure
+
+    elif plotting_package == "plotly":
+
+        # spectra are annotated on the axes their line was plotted on
+        panels = {}
+        for key in analysis:
+            axes = ("x", "y")
+            for trace in figure.data:
+                if trace.name == key:
+                    axes = (trace.xaxis or "x", trace.yaxis or "y")
+            panels.setdefault(axes, {})[key] = analysis[key]
+
+        for panel_number, (axes, panel_analysis) in enumerate(panels.items()):
+            add_plotly_analysis_annotations(
+                figure, panel_analysis, axes, overlay_axis_number=100 + panel_number
+            )
+
+        return figure
+
+    else:
+        msg = f'plotting_package must be set to "matplotlib" or "plotly" not {plotting_package}'
+        raise ValueError(msg)
+
+
+def add_matplotlib_analysis_annotations(axis, analysis: Dict[str, dict]):
+    """Adds the peaks and summary of the analysis to a matplotlib axes"""
+
+    peaks = {}
+    for result in analysis.values():
+        peaks.update(result["peaks"])
+
+    for name, energy in peaks.items():
+        axis.axvline(energy, color="k", linestyle="--", linewidth=0.8)
+        axis.text(
+            energy,
+            1.0,
+            name,
+            transform=axis.get_xaxis_transform(),
+            rotation=90,
+            horizontalalignment="right",
+            verticalalignment="top",
+        )
+
+    summary = "\n".join(
+        line
+        for key, result in analysis.items()
+        for line in format_analysis_summary(key, result)
+    )
+    axis.text(
+        0.02,
+        0.98,
+        summary,
+        transform=axis.transAxes,
+        fontsize="x-small",
+        horizontalalignment="left",
+        verticalalignment="top",
+        bbox={"facecolor": "white", "alpha": 0.7, "edgecolor": "none"},
+    )
+
+
+def add_plotly_analysis_annotations(
+    figure,
+    analysis: Dict[str, dict],
+    axes: tuple,
+    overlay_axis_number: int,
+):
+    """Adds the peaks and summary of the analysis to the plotly axes named in
+    axes, for example ("x", "y") or ("x2", "y2") for a grid figure"""
+
+    x_axis, y_axis = axes
+    overlay_axis = f"y{overlay_axis_number}"
+
+    peaks = {}
+    for result in analysis.values():
+        peaks.update(result["peaks"])
+
+    for name, energy in peaks.items():
+        # scatter traces are used rather than shapes as shapes on log
+        # axes need log positions which the log/lin dropdown would break
+        figure.add_trace(
+            {
+                "type": "scatter",
+                "mode": "lines+text",
+                "x": [energy, energy],
+                "y": [0, 1],
+                "xaxis": x_axis,
+                "yaxis": overlay_axis,
+                "text": [None, name],
+                "textposition": "bottom left",
+                "name": name,
+                "showlegend": False,
+                "hoverinfo": "name+x",
+                "line": {"color": "black", "dash": "dash", "width": 1},
+            }
+        )
+
+    if peaks:
+        # an invisible axis spanning the panel height for the peak lines
+        figure.update_layout(
+            {
+                f"yaxis{overlay_axis_number}": {
+                    "overlaying": y_axis,
+                    "anchor": x_axis,
+                    "range": [0, 1],
+                    "visible": False,
+                    "fixedrange": True,
+                }
+            }
+        )
+
+    summary = "<br>".join(
+        line
+        for key, result in analysis.items()
+        for line in format_analysis_summary(key, result)
+    )
+    figure.add_annotation(
+        text=summary,
+        xref=f"{x_axis} domain",
+        yref=f"{y_axis} domain",
+        x=0.02,
+        y=0.98,
+        xanchor="left",
+        yanchor="top",
+        align="left",
+        showarrow=False,
+        font={"size": 10},
+        bgcolor="rgba(255,255,255,0.7)",
+    )
@@ -1,16 +1,74 @@
+import html
+import json
+import math
 from pathlib import Path
-from typing import Dict, Iterable, Optional, Tuple, Union
+from typing import Dict, Iterable, List, Optional, Tuple, Union
 
 import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
 import numpy as np
 import openmc_tally_unit_converter as otuc
 import plotly.graph_objects as go
+from plotly.offline import get_plotlyjs
+from plotly.subplots import make_subplots
+from plotly.utils import PlotlyJSONEncoder
 from numpy import ndarray
 from numpy.lib.function_base import trim_zeros
 
+from .spectrum import Spectrum, SpectrumSet, to_spectrum
+
+# the page used by save_plots_as_html_bundle, figures are drawn lazily when
+# they are scrolled into view
+HTML_BUNDLE_HEADER = """<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8" />
+<script src="plotly.min.js"></script>
+<style>.spectrum-plot { min-height: 450px; }</style>
+</head>
+<body>
+"""
+
+HTML_BUNDLE_FOOTER = """<script>
+var templates = {};
+function drawSpectrumPlot(element) {
+    var figure = JSON.parse(
+        document.getElementById(element.dataset.figure).textContent
+    );
+    var templateId = element.dataset.template;
+    if (templateId) {
+        // each shared template is only parsed once
+        if (!(templateId in templates)) {
+            templates[templateId] = JSON.parse(
+                document.getElementById(templateId).textContent
+            );
+        }
+        figure.layout.template = templates[templateId];
+    }
+    Plotly.newPlot(element, figure.data, figure.layout);
+}
+var plots = document.querySelectorAll(".spectrum-plot");
+if ("IntersectionObserver" in window) {
+    var observer = new IntersectionObserver(function (entries) {
+        entries.forEach(function (entry) {
+            if (entry.isIntersecting) {
+                observer.unobserve(entry.target);
+                drawSpectrumPlot(entry.target);
+            }
+        });
+    }, {rootMargin: "200px"});
+    plots.forEach(function (element) { observer.observe(element); });
+} else {
+    plots.forEach(drawSpectrumPlot);
+}
+</script>
+</body>
+</html>
+"""
+
 
 def plot_spectrum_from_tally(
-    spectrum: dict,
+    spectrum: Union[dict, SpectrumSet],
     x_label: Optional[str] = "",
     y_label: Optional[str] = "",
     x_scale: Optional[str] = "linear",
@@ -24,6 +82,7 @@ def plot_spectrum_from_tally(
     required_energy_units: str = "eV",
     source_strength: float = None,
     volume: float = None,
+    html_plotlyjs: str = "inline",
 ):
     """Plots a stepped line graph with optional shaded region for Y error.
     Intended use for ploting neutron / photon spectra
@@ -33,7 +92,9 @@ def plot_spectrum_from_tally(
             dictionary values openmc.Tally objects. The tally objects can be
             accessed with the regular openmc.StatePoint('statepoint.batches.h5')
             method. Spectrum tallies should include an
-            openmc.filter.EnergyFilter
+            openmc.filter.EnergyFilter. Dictionary values can also be
+            already processed Spectrum objects in the required units and a
+            SpectrumSet can be passed in place of the dictionary.
         x_label: the label to use on the x axis,
         y_label: the label to use on the y axis,
         x_scale: the scale to use for the x axis. Options are 'linear', 'log'
@@ -61,28 +122,22 @@ def plot_spectrum_from_tally(
         volume: The volume which is to be used for volume normalisation. A
             numeric value is expected but the units are assumed to be in cm**3
             (centimeters cubed).
+        html_plotlyjs: how plotly.js is provided when saving plotly plots as
+            .html files. Options are 'inline' which embeds plotly.js in the
+            file or 'directory' which writes a single plotly.min.js to the
+            output directory that is shared by all html files saved there.
 
     Returns:
         the matplotlib.pyplot or plotly.graph_objects object produced
     """
 
-    dictionary_of_values = {}
-
-    for key, value in spectrum.items():
-
-        x_y_y_err = otuc.process_spectra_tally(
-            tally=value,
-            required_units=required_units,
-            required_energy_units=required_energy_units,
-            source_strength=source_strength,
-            volume=volume,
-        )
-        if len(x_y_y_err) == 3:
-            x, y, y_err = x_y_y_err
-            dictionary_of_values[key] = (x, y, y_err)
-        else:
-            x, y = x_y_y_err
-            dictionary_of_values[key] = (x, y)
+    dictionary_of_values = process_spectrum_tallies(
+        spectrum=spectrum,
+        required_units=required_units,
+        required_energy_units=required_energy_units,
+        source_strength=source_strength,
+        volume=volume,
+    )
 
     plot = plot_spectrum_from_values(
         spectrum=dictionary_of_values,
@@ -95,13 +150,14 @@ def plot_spectrum_from_tally(
         legend=legend,
         filename=filename,
         plotting_package=plotting_package,
+        html_plotlyjs=html_plotlyjs,
     )
 
     return plot
 
 
 def plot_spectrum_from_values(
-    spectrum: Dict[str, Tuple[ndarray, ndarray, ndarray]],
+    spectrum: Union[Dict[str, Tuple[ndarray, ndarray, ndarray]], SpectrumSet],
     x_label: Optional[str] = "",
     y_label: Optional[str] = "",
     x_scale: Optional[str] = "linear",
@@ -111,6 +167,7 @@ def plot_spectrum_from_values(
     filename: Optional[str] = None,
     plotting_package: Optional[str] = "matplotlib",
     trim_zeros: bool = True,
+    html_plotlyjs: str = "inline",
 ):
     """Plots a stepped line graph with optional shaded region for Y error.
     Intended use for ploting neutron / photon spectra
@@ -119,7 +176,8 @@ def plot_spectrum_from_values(
         spectrum: A dictionary of where the key is the spectra title and the
             dictionary values are a list containing x and y values. Optionally
             y_error values can also be included in the list. x, y and y_error
-            should all be numpy arrays.
+            should all be numpy arrays. Dictionary values can also be Spectrum
+            objects and a SpectrumSet can be passed in place of the dictionary.
         x_label: the label to use on the x axis,
         y_label: the label to use on the y axis,
         x_scale: the scale to use for the x axis. Options are 'linear', 'log'
@@ -135,6 +193,10 @@ def plot_spectrum_from_values(
         trim_zeros: whether any zero values at the end of the x iterable
             should be removed from the plot. This is useful when using standard
             energy groups that go beyond the energy of the particles simulated.
+        html_plotlyjs: how plotly.js is provided when saving plotly plots as
+            .html files. Options are 'inline' which embeds plotly.js in the
+            file or 'directory' which writes a single plotly.min.js to the
+            output directory that is shared by all html files saved there.
 
     Returns:
         the matplotlib.pyplot or plotly.graph_objects object produced
@@ -163,23 +225,360 @@ def plot_spectrum_from_values(
     if legend and plotting_package == "matplotlib":
         figure.legend()
 
-    save_plot(plotting_package=plotting_package, filename=filename, figure=figure)
+    save_plot(
+        plotting_package=plotting_package,
+        filename=filename,
+        figure=figure,
+        html_plotlyjs=html_plotlyjs,
+    )
+
+    return figure
+
+
+def plot_spectrum_grid_from_tally(
+    spectrum: Union[dict, SpectrumSet],
+    x_label: Optional[str] = "",
+    y_label: Optional[str] = "",
+    x_scale: Optional[str] = "linear",
+    y_scale: Optional[str] = "linear",
+    title: Optional[str] = "",
+    columns: int = 4,
+    filename: Optional[str] = None,
+    plotting_package: Optional[str] = "matplotlib",
+    trim_zeros: bool = True,
+    required_units: str = "centimeters / source_particle",
+    required_energy_units: str = "eV",
+    source_strength: float = None,
+    volume: float = None,
+    html_plotlyjs: str = "inline",
+):
+    """Plots a grid of stepped line graphs, one panel per spectrum, with
+    optional shaded regions for Y error. All panels share their axes and are
+    drawn into a single figure which is saved once.
+
+    Arguments:
+        spectrum: A dictionary of where the key is the panel title and the
+            dictionary values openmc.Tally objects. The tally objects can be
+            accessed with the regular openmc.StatePoint('statepoint.batches.h5')
+            method. Spectrum tallies should include an
+            openmc.filter.EnergyFilter. Dictionary values can also be
+            already processed Spectrum objects in the required units and a
+            SpectrumSet can be passed in place of the dictionary.
+        x_label: the label to use on the x axis,
+        y_label: the label to use on the y axis,
+        x_scale: the scale to use for the x axis. Options are 'linear', 'log'
+        y_scale: the scale to use for the y axis. Options are 'linear', 'log'
+        title: the title applied to the top of the plot
+        columns: the maximum number of panels in each row of the grid
+        filename: the filename to save the plot as should end with the correct
+            extention supported by matplotlib (e.g .png) or plotly (e.g .html)
+        plotting_package: the name of the python package to use when producing
+            the plots. Options are 'matplotlib' or 'plotly'
+        trim_zeros: whether any zero values at the end of the x iterable
+            should be removed from the plot. This is useful when using standard
+            energy groups that go beyond the energy of the particles simulated.
+        required_units: The units desired for the Y axis. Defaults to
+            "centimeters / source_particle" but supports units identified in
+            the Python Pint package. If volume normalisation or source strength
+            normalisation are required by the units then these arguments must
+            also be provided.
+        required_energy_units: "eV",
+        source_strength: The strength of the source which is to be used for
+            source normalization. A numeric value is expected but the units are
+            assumed to be in particles per second or particles per pulse.
+        volume: The volume which is to be used for volume normalisation. A
+            numeric value is expected but the units are assumed to be in cm**3
+            (centimeters cubed).
+        html_plotlyjs: how plotly.js is provided when saving plotly plots as
+            .html files. Options are 'inline' which embeds plotly.js in the
+            file or 'directory' which writes a single plotly.min.js to the
+            output directory that is shared by all html files saved there.
+
+    Returns:
+        the matplotlib.figure.Figure or plotly.graph_objects object produced.
+        The matplotlib figure is not managed by pyplot so it is saved with
+        its savefig method rather than shown with pyplot.show
+    """
+
+    dictionary_of_values = process_spectrum_tallies(
+        spectrum=spectrum,
+        required_units=required_units,
+        required_energy_units=required_energy_units,
+        source_strength=source_strength,
+        volume=volume,
+    )
+
+    plot = plot_spectrum_grid_from_values(
+        spectrum=dictionary_of_values,
+        x_label=x_label,
+        y_label=y_label,
+        x_scale=x_scale,
+        y_scale=y_scale,
+        title=title,
+        columns=columns,
+        trim_zeros=trim_zeros,
+        filename=filename,
+        plotting_package=plotting_package,
+        html_plotlyjs=html_plotlyjs,
+    )
+
+    return plot
+
+
+def plot_spectrum_grid_from_values(
+    spectrum: Union[Dict[str, Tuple[ndarray, ndarray, ndarray]], SpectrumSet],
+    x_label: Optional[str] = "",
+    y_label: Optional[str] = "",
+    x_scale: Optional[str] = "linear",
+    y_scale: Optional[str] = "linear",
+    title: Optional[str] = "",
+    columns: int = 4,
+    filename: Optional[str] = None,
+    plotting_package: Optional[str] = "matplotlib",
+    trim_zeros: bool = True,
+    html_plotlyjs: str = "inline",
+):
+    """Plots a grid of stepped line graphs, one panel per spectrum, with
+    optional shaded regions for Y error. All panels share their axes and are
+    drawn into a single figure which is saved once. This is much quicker than
+    producing a separate plot for each spectrum when comparing many spectra.
+
+    Arguments:
+        spectrum: A dictionary of where the key is the panel title and the
+            dictionary values are a list containing x and y values. Optionally
+            y_error values can also be included in the list. x, y and y_error
+            should all be numpy arrays. Dictionary values can also be Spectrum
+            objects and a SpectrumSet can be passed in place of the dictionary.
+        x_label: the label to use on the x axis,
+        y_label: the label to use on the y axis,
+        x_scale: the scale to use for the x axis. Options are 'linear', 'log'
+        y_scale: the scale to use for the y axis. Options are 'linear', 'log'
+        title: the title applied to the top of the plot
+        columns: the maximum number of panels in each row of the grid
+        filename: the filename to save the plot as should end with the correct
+            extention supported by matplotlib (e.g .png) or plotly (e.g .html)
+        plotting_package: the name of the python package to use when producing
+            the plots. Options are 'matplotlib' or 'plotly'
+        trim_zeros: whether any zero values at the end of the x iterable
+            should be removed from the plot. This is useful when using standard
+            energy groups that go beyond the energy of the particles simulated.
+        html_plotlyjs: how plotly.js is provided when saving plotly plots as
+            .html files. Options are 'inline' which embeds plotly.js in the
+            file or 'directory' which writes a single plotly.min.js to the
+            output directory that is shared by all html files saved there.
+
+    Returns:
+        the matplotlib.figure.Figure or plotly.graph_objects object produced.
+        The matplotlib figure is not managed by pyplot so it is saved with
+        its savefig method rather than shown with pyplot.show
+    """
+
+    if columns < 1:
+        raise ValueError(f"columns must be a positive integer not {columns}")
+
+    figure = add_grid_axis_title_labels(
+        x_label=x_label,
+        y_label=y_label,
+        y_scale=y_scale,
+        x_scale=x_scale,
+        title=title,
+        subplot_titles=list(spectrum.keys()),
+        columns=columns,
+        plotting_package=plotting_package,
+    )
+
+    for index, (key, value) in enumerate(spectrum.items()):
+
+        if plotting_package == "matplotlib":
+            add_spectra_to_plot(
+                value,
+                trim_zeros,
+                label=key,
+                plotting_package=plotting_package,
+                figure=figure.axes[index],
+            )
+        else:
+            add_spectra_to_plot(
+                value,
+                trim_zeros,
+                label=key,
+                plotting_package=plotting_package,
+                figure=figure,
+                row=index // columns + 1,
+                col=index % columns + 1,
+            )
+
+    save_plot(
+        plotting_package=plotting_package,
+        filename=filename,
+        figure=figure,
+        html_plotlyjs=html_plotlyjs,
+    )
 
     return figure
 
 
-def save_plot(plotting_package: str, filename: str, figure):
+def process_spectrum_tallies(
+    spectrum: Union[dict, SpectrumSet],
+    required_units: str = "centimeters / source_particle",
+    required_energy_units: str = "eV",
+    source_strength: float = None,
+    volume: float = None,
+) -> SpectrumSet:
+    """Converts a dictionary of openmc.Tally objects into a SpectrumSet with
+    the values in the required units. Spectrum objects are kept unchanged and
+    a ValueError is raised if their units or energy units are set and are
+    not the required units, as Spectrum objects are not converted"""
+
+    spectra = {}
+
+    for key, value in spectrum.items():
+
+        if isinstance(value, Spectrum):
+            for units, required, name in [
+                (value.units, required_units, "units"),
+                (value.energy_units, required_energy_units, "energy_units"),
+            ]:
+                if units is not None and units != required:
+                    msg = (
+                        f'Spectrum "{key}" has {name} of "{units}" which do not '
+                        f'match the required {name} of "{required}"'
+                    )
+                    raise ValueError(msg)
+            spectra[key] = value
+            continue
+
+        x_y_y_err = otuc.process_spectra_tally(
+            tally=value,
+            required_units=required_units,
+            required_energy_units=required_energy_units,
+            source_strength=source_strength,
+            volume=volume,
+        )
+        spectra[key] = Spectrum(
+            *x_y_y_err,
+            energy_units=required_energy_units,
+            units=required_units,
+            metadata={"tally_name": getattr(value, "name", None)},
+        )
+
+    return SpectrumSet(spectra)
+
+
+def save_plot(
+    plotting_package: str, filename: str, figure, html_plotlyjs: str = "inline"
+):
     """Saves the matplotlib or plotly graph object as a file."""
     if filename:
         if plotting_package == "matplotlib":
             figure.savefig(filename, bbox_inches="tight", dpi=400)
         elif plotting_package == "plotly":
             if Path(filename).suffix == ".html":
-                figure.write_html(filename)
+                figure.write_html(
+                    filename, include_plotlyjs=get_include_plotlyjs(html_plotlyjs)
+                )
             else:
                 figure.write_image(filename)
 
 
+def get_include_plotlyjs(html_plotlyjs: str) -> Union[bool, str]:
+    """Converts the html_plotlyjs option into the include_plotlyjs argument
+    used by plotly. The plotly.js CDN is not offered as the html files must
+    work offline"""
+
+    if html_plotlyjs == "inline":
+        return True
+    elif html_plotlyjs == "directory":
+        return "directory"
+
+    msg = f'html_plotlyjs must be set to "inline" or "directory" not {html_plotlyjs}'
+    raise ValueError(msg)
+
+
+def save_plots_as_html_bundle(
+    figures: Union[Dict[str, go.Figure], Iterable[Tuple[str, go.Figure]]],
+    filename: str,
+):
+    """Saves many plotly graph objects into a single html page. The
+    plotly.js library is written once to plotly.min.js in the output
+    directory and referenced from the page. Each figure is stored as JSON
+    that is only parsed and drawn when the figure is scrolled into view, so
+    pages with many spectra load quickly. The layout template is written
+    once and shared by all the figures that use it.
+
+    Arguments:
+        figures: A dictionary where the key is the figure title and the
+            dictionary values are plotly.graph_objects.Figure objects, for
+            example those returned by plot_spectrum_from_values with
+            plotting_package='plotly'. An iterable of (title, figure) pairs
+            can be passed instead, such as a generator that creates each
+            figure when it is needed so that only one figure is held in
+            memory at a time.
+        filename: the filename to save the html page as, should end with .html
+    """
+
+    if hasattr(figures, "items"):
+        figures = figures.items()
+
+    path = Path(filename)
+    write_plotlyjs_to_directory(path.parent)
+
+    # the index of each distinct template that has been written to the page
+    template_indexes = {}
+
+    with open(path, "w", encoding="utf-8") as html_file:
+        html_file.write(HTML_BUNDLE_HEADER)
+
+        for index, (key, figure) in enumerate(figures):
+            figure_dict = figure.to_plotly_json()
+            template = figure_dict["layout"].pop("template", None)
+
+            template_attribute = ""
+            if template is not None:
+                template_json = to_html_safe_json(template)
+                if template_json not in template_indexes:
+                    template_index = len(template_indexes)
+                    template_indexes[template_json] = template_index
+                    html_file.write(
+                        f'<script type="application/json" '
+                        f'id="spectrum-template-{template_index}">'
+                        f"{template_json}</script>\n"
+                    )
+                template_attribute = (
+                    f' data-template="spectrum-template-'
+                    f'{template_indexes[template_json]}"'
+                )
+
+            html_file.write(
+                f"<h2>{html.escape(str(key))}</h2>\n"
+                f'<div class="spectrum-plot" id="spectrum-plot-{index}" '
+                f'data-figure="spectrum-figure-{index}"{template_attribute}></div>\n'
+                f'<script type="application/json" id="spectrum-figure-{index}">'
+                f"{to_html_safe_json(figure_dict)}</script>\n"
+            )
+
+        html_file.write(HTML_BUNDLE_FOOTER)
+
+
+def to_html_safe_json(value) -> str:
+    """Converts plotly figure data into JSON that can be placed inside a html
+    script tag. "</" is escaped so the JSON can not close the script tag"""
+
+    return json.dumps(value, cls=PlotlyJSONEncoder).replace("</", "<\\/")
+
+
+def write_plotlyjs_to_directory(directory: Union[str, Path]) -> Path:
+    """Writes the plotly.js library to plotly.min.js in the directory if it is
+    not already present. This is the same file written by plotly when saving
+    html files with include_plotlyjs='directory' so it is shared by both"""
+
+    plotlyjs_path = Path(directory) / "plotly.min.js"
+    if not plotlyjs_path.exists():
+        plotlyjs_path.write_text(get_plotlyjs(), encoding="utf-8")
+
+    return plotlyjs_path
+
+
 def add_axis_title_labels(
     x_label: str,
     y_label: str,
@@ -217,45 +616,101 @@ def add_axis_title_labels(
             yaxis={"title": y_label, "type": y_scale},
         )
 
-        if x_scale == "log":
-            not_x_scale = "lin"
-        else:
-            not_x_scale = "log"
+        add_axis_scale_dropdown(figure=figure, x_scale=x_scale, y_scale=y_scale)
 
-        if y_scale == "log":
-            not_y_scale = "lin"
-        else:
-            not_y_scale = "log"
-
-        buttons_list = []
-        for xscale in [x_scale, not_x_scale]:
-            for yscale in [y_scale, not_y_scale]:
-                buttons_list.append(
-                    {
-                        "args": [
-                            {
-                                "xaxis.type": xscale,
-                                "yaxis.type": yscale,
-                            }
-                        ],
-                        "label": f"{xscale}(x) , {yscale}(y)",
-                        "method": "relayout",
-                    }
+        return figure
+
+    else:
+        msg = f'plotting_package must be set to "matplotlib" or "plotly" not {plotting_package}'
+        raise ValueError(msg)
+
+
+def add_grid_axis_title_labels(
+    x_label: str,
+    y_label: str,
+    y_scale: str,
+    x_scale: str,
+    title: str,
+    subplot_titles: List[str],
+    columns: int,
+    plotting_package: str,
+):
+    """Creates a matplotlib or plotly figure with a grid of panels that share
+    their axes and adds the axis labels, panel titles and the title to it"""
+
+    number_of_panels = max(len(subplot_titles), 1)
+    columns = min(columns, number_of_panels)
+    rows = math.ceil(number_of_panels / columns)
+
+    if plotting_package == "matplotlib":
+
+        # the figure is not registered with pyplot so it is freed when it is
+        # no longer referenced rather than accumulating in pyplot
+        figure = Figure(figsize=(4 * columns, 3 * rows))
+        axes = figure.subplots(
+            rows,
+            columns,
+            sharex=True,
+            sharey=True,
+            squeeze=False,
+        )
+
+        axes = axes.flatten()
+        for index, axis in enumerate(axes):
+            if index >= len(subplot_titles):
+                axis.set_visible(False)
+                continue
+
+            axis.set_title(subplot_titles[index])
+            axis.set_yscale(y_scale)
+            axis.set_xscale(x_scale)
+
+            # panels without a visible panel below them need x tick labels
+            if index + columns >= len(subplot_titles):
+                axis.xaxis.set_tick_params(labelbottom=True)
+                axis.set_xlabel(x_label)
+            if index % columns == 0:
+                axis.set_ylabel(y_label)
+
+        # removes the hidden panels so figure.axes only contains used panels
+        for axis in axes[len(subplot_titles) :]:
+            figure.delaxes(axis)
+
+        figure.suptitle(title)
+
+        return figure
+
+    elif plotting_package == "plotly":
+        figure = make_subplots(
+            rows=rows,
+            cols=columns,
+            shared_xaxes=True,
+            shared_yaxes=True,
+            subplot_titles=subplot_titles,
+        )
+
+        figure.update_layout(title=title, showlegend=False)
+        figure.update_xaxes(type=x_scale)
+        figure.update_yaxes(type=y_scale)
+        figure.update_yaxes(title=y_label, col=1)
+
+        # plotly numbers the subplot axes xaxis, xaxis2 ... along each row
+        for index in range(rows * columns):
+            suffix = "" if index == 0 else str(index + 1)
+            if index >= len(subplot_titles):
+                figure.layout[f"xaxis{suffix}"].visible = False
+                figure.layout[f"yaxis{suffix}"].visible = False
+            # panels without a used panel below them need x tick labels
+            elif index + columns >= len(subplot_titles):
+                figure.layout[f"xaxis{suffix}"].update(
+                    showticklabels=True, title=x_label
                 )
 
-        # this adds the dropdown box for log and lin axis selection
-        figure.update_layout(
-            updatemenus=[
-                go.layout.Updatemenu(
-                    buttons=buttons_list,
-                    pad={"r": 10, "t": 10},
-                    showactive=True,
-                    x=0.5,
-                    xanchor="left",
-                    y=1.1,
-                    yanchor="top",
-                ),
-            ]
+        add_axis_scale_dropdown(
+            figure=figure,
+            x_scale=x_scale,
+            y_scale=y_scale,
+            number_of_subplots=rows * columns,
         )
 
         return figure
@@ -265,41 +720,89 @@ def add_axis_title_labels(
         raise ValueError(msg)
 
 
+def add_axis_scale_dropdown(
+    figure: go.Figure,
+    x_scale: str,
+    y_scale: str,
+    number_of_subplots: int = 1,
+):
+    """Adds a dropdown box for log and lin axis selection to the plotly graph
+    object. The selection is applied to the axes of every subplot"""
+
+    if x_scale == "log":
+        not_x_scale = "lin"
+    else:
+        not_x_scale = "log"
+
+    if y_scale == "log":
+        not_y_scale = "lin"
+    else:
+        not_y_scale = "log"
+
+    # plotly names the axes of the first subplot xaxis and yaxis then xaxis2 ...
+    axis_suffixes = [""] + [str(i) for i in range(2, number_of_subplots + 1)]
+
+    buttons_list = []
+    for xscale in [x_scale, not_x_scale]:
+        for yscale in [y_scale, not_y_scale]:
+            args = {}
+            for suffix in axis_suffixes:
+                args[f"xaxis{suffix}.type"] = xscale
+                args[f"yaxis{suffix}.type"] = yscale
+            buttons_list.append(
+                {
+                    "args": [args],
+                    "label": f"{xscale}(x) , {yscale}(y)",
+                    "method": "relayout",
+                }
+            )
+
+    # this adds the dropdown box for log and lin axis selection
+    figure.update_layout(
+        updatemenus=[
+            go.layout.Updatemenu(
+                buttons=buttons_list,
+                pad={"r": 10, "t": 10},
+                showactive=True,
+                x=0.5,
+                xanchor="left",
+                y=1.1,
+                yanchor="top",
+            ),
+        ]
+    )
+
+    return figure
+
+
 def add_spectra_to_plot(
-    spectra: Tuple[ndarray, ndarray, ndarray],
+    spectra: Union[Tuple[ndarray, ndarray, ndarray], Spectrum],
     trim_zeros: bool,
     label: Union[str, None],
     plotting_package: str,
     figure,
+    row: Optional[int] = None,
+    col: Optional[int] = None,
 ):
-    """Adds a step line to the matplotlib or plotly graph object"""
+    """Adds a step line to the matplotlib or plotly graph object. The row and
+    col arguments select the subplot when adding to a plotly grid figure"""
     # mid and post are also options but pre is used as energy bins start from 0
 
-    x = spectra[0]
-    y = spectra[1]
-    if len(spectra) == 3:
-        y_err = spectra[2]
-
-    # trimming required for spectra energy groups which have one more energy bin
-    if len(x) == len(y) + 1:
-        x = x[:-1]
+    spectrum = to_spectrum(spectra)
 
     if trim_zeros is True:
-        y = np.trim_zeros(np.array(y), trim="b")
-        x = np.array(x[: len(y)])
-        if len(spectra) == 3:
-            y_err = np.array(y_err[: len(y)])
-    else:
-        y = np.array(y)
-        x = np.array(x)
-        if len(spectra) == 3:
-            y_err = np.array(y_err)
+        spectrum = spectrum.trim_zeros()
+
+    # energy bin starts are used as energy groups can have one more energy bin
+    x = spectrum.energy_bin_starts
+    y = spectrum.values
+    y_err = spectrum.std_dev
 
     if plotting_package == "matplotlib":
 
         figure.step(x, y, where="pre", label=label)
 
-        if len(spectra) == 3:
+        if spectrum.has_std_dev:
             lower_y = y - y_err
             upper_y = y + y_err
             figure.fill_between(x, lower_y, upper_y, step="pre", color="k", alpha=0.15)
@@ -311,7 +814,7 @@ def add_spectra_to_plot(
         # options are 'linear', 'spline', 'hv', 'vh', 'hvh', 'vhv'
         shape = "hv"
 
-        if len(spectra) == 3:
+        if spectrum.has_std_dev:
             # adds a line for the upper stanadard deviation bound
             figure.add_trace(
                 go.Scatter(
@@ -320,7 +823,9 @@ def add_spectra_to_plot(
                     y=y + y_err,
                     name="std. dev. upper",
                     line=dict(shape=shape, width=0),
-                )
+                ),
+                row=row,
+                col=col,
             )
 
             # adds a line for the lower stanadard deviation bound
@@ -335,7 +840,9 @@ def add_spectra_to_plot(
                     fill="tonextx",
                     fillcolor=f"rgba{(0.2,0.2,0.2, 0.1)}",
                     line=dict(shape=shape, width=0),
-                )
+                ),
+                row=row,
+                col=col,
             )
 
         # adds a line for the tally result
@@ -346,7 +853,9 @@ def add_spectra_to_plot(
                 y=y,
                 name=label,
                 line=dict(shape=shape),
-            )
+            ),
+            row=row,
+            col=col,
         )
 
         return figure
@@ -0,0 +1,435 @@
+import json
+from typing import Dict, Optional, Tuple, Union
+from urllib.parse import parse_qs
+
+import numpy as np
+from plotly.offline import get_plotlyjs
+
+from .core import add_axis_title_labels, process_spectrum_tallies, to_html_safe_json
+from .spectrum import Spectrum, SpectrumSet, to_spectrum
+
+# the page served by create_dashboard_app, {{layout}} is replaced by the plotly
+# layout which includes the dropdown for log and lin axis selection
+DASHBOARD_PAGE = """<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8" />
+<script src="/plotly.min.js"></script>
+<style>
+body { display: flex; font-family: sans-serif; margin: 0; }
+#spectra { width: 250px; height: 100vh; }
+#plot { flex: 1; height: 100vh; }
+</style>
+</head>
+<body>
+<select id="spectra" multiple></select>
+<div id="plot"></div>
+<script>
+var layout = {{layout}};
+var plot = document.getElementById("plot");
+var select = document.getElementById("spectra");
+
+// keeps the log and lin axis selection across reloads
+["xaxis", "yaxis"].forEach(function (axis) {
+    var axisType = localStorage.getItem("spectrum-plotter-" + axis + "-type");
+    if (axisType !== null) {
+        layout[axis].type = axisType;
+    }
+});
+
+function selectedSpectra() {
+    return Array.from(select.selectedOptions).map(function (o) { return o.value; });
+}
+
+function energyRange() {
+    var xaxis = plot.layout.xaxis;
+    if (xaxis.autorange || !xaxis.range) {
+        return "";
+    }
+    var range = xaxis.range.slice();
+    if (xaxis.type === "log") {
+        range = range.map(function (value) { return Math.pow(10, value); });
+    }
+    return "?energy_min=" + range[0] + "&energy_max=" + range[1];
+}
+
+function loadSpectra(query) {
+    var names = selectedSpectra();
+    Promise.all(names.map(function (name) {
+        return fetch("/spectra/" + encodeURIComponent(name) + query)
+            .then(function (response) { return response.json(); });
+    })).then(function (results) {
+        var traces = [];
+        results.forEach(function (data, index) {
+            if (data.y_err !== undefined) {
+                // the standard deviation band drawn as in add_spectra_to_plot
+                traces.push({
+                    mode: "lines",
+                    x: data.x,
+                    y: data.y.map(function (y, i) { return y + data.y_err[i]; }),
+                    name: "std. dev. upper",
+                    showlegend: false,
+                    line: {shape: "hv", width: 0}
+                });
+                traces.push({
+                    mode: "lines",
+                    x: data.x,
+                    y: data.y.map(function (y, i) { return y - data.y_err[i]; }),
+                    name: "std. dev. lower",
+                    showlegend: false,
+                    fill: "tonextx",
+                    fillcolor: "rgba(0.2,0.2,0.2,0.1)",
+                    line: {shape: "hv", width: 0}
+                });
+            }
+            traces.push({
+                mode: "lines",
+                x: data.x,
+                y: data.y,
+                name: names[index],
+                line: {shape: "hv"}
+            });
+        });
+        Plotly.react(plot, traces, plot.layout);
+    });
+}
+
+Plotly.newPlot(plot, [], layout).then(function () {
+    plot.on("plotly_relayout", function (event) {
+        ["xaxis", "yaxis"].forEach(function (axis) {
+            if (event[axis + ".type"] !== undefined) {
+                localStorage.setItem(
+                    "spectrum-plotter-" + axis + "-type", event[axis + ".type"]
+                );
+            }
+        });
+        if (event["xaxis.range[0]"] !== undefined || event["xaxis.autorange"]) {
+            loadSpectra(energyRange());
+        }
+    });
+});
+
+fetch("/spectra").then(function (response) { return response.json(); })
+    .then(function (names) {
+        names.forEach(function (name, index) {
+            var option = document.createElement("option");
+            option.value = name;
+            option.text = name;
+            option.selected = index === 0;
+            select.appendChild(option);
+        });
+        loadSpectra("");
+    });
+
+select.addEventListener("change", function () { loadSpectra(energyRange()); });
+</script>
+</body>
+</html>
+"""
+
+
+class SpectrumCache:
+    """An in-memory cache of processed spectra. Tallies are only processed
+    into Spectrum objects the first time they are requested and the decimated
+    overview of each spectrum is also kept so it is only calculated once.
+
+    Arguments:
+        spectrum: A dictionary where the key is the spectrum title and the
+            dictionary values are openmc.Tally objects, Spectrum objects or
+            tuples of x, y and optionally y_error values. A SpectrumSet can
+            be passed in place of the dictionary.
+        required_units: The units desired for the Y axis of tallies.
+        required_energy_units: The units desired for the X axis of tallies.
+        source_strength: The strength of the source which is to be used for
+            source normalization of tallies.
+        volume: The volume which is to be used for volume normalisation of
+            tallies.
+    """
+
+    def __init__(
+        self,
+        spectrum: Union[dict, SpectrumSet],
+        required_units: str = "centimeters / source_particle",
+        required_energy_units: str = "eV",
+        source_strength: float = None,
+        volume: float = None,
+    ):
+        self.unprocessed = dict(spectrum)
+        self.required_units = required_units
+        self.required_energy_units = required_energy_units
+        self.source_strength = source_strength
+        self.volume = volume
+        self.spectra = {}
+        self.overviews = {}
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.unprocessed
+
+    def keys(self):
+        return self.unprocessed.keys()
+
+    def __getitem__(self, key: str) -> Spectrum:
+        if key not in self.spectra:
+            value = self.unprocessed[key]
+            if isinstance(value, (tuple, list)):
+                value = to_spectrum(value)
+            self.spectra[key] = process_spectrum_tallies(
+                spectrum={key: value},
+                required_units=self.required_units,
+                required_energy_units=self.required_energy_units,
+                source_strength=self.source_strength,
+                volume=self.volume,
+            )[key]
+        return self.spectra[key]
+
+    def get_overview(self, key: str, max_points: int) -> dict:
+        """Returns the decimated data for the full energy range of a spectrum"""
+        if (key, max_points) not in self.overviews:
+            self.overviews[(key, max_points)] = decimate_spectrum(
+                self[key], max_points=max_points
+            )
+        return self.overviews[(key, max_points)]
+
+
+def decimate_spectrum(
+    spectrum: Spectrum,
+    energy_min: Optional[float] = None,
+    energy_max: Optional[float] = None,
+    max_points: int = 2000,
+    trim_zeros: bool = True,
+) -> dict:
+    """Returns the step data of a spectrum within an energy range with no more
+    than max_points points. When there are more energy bins than max_points
+    the bins are grouped and the maximum and minimum value of each group are
+    kept so that peaks remain visible in the decimated data.
+
+    Arguments:
+        spectrum: the Spectrum to decimate.
+        energy_min: the lowest energy to include, defaults to the whole range.
+        energy_max: the highest energy to include, defaults to the whole range.
+        max_points: the maximum number of points to return.
+        trim_zeros: whether any zero values at the high energy end of the
+            spectrum should be removed.
+
+    Returns:
+        A dictionary with "x", "y" and when available "y_err" lists along
+        with "decimated" which is True if bins have been grouped.
+    """
+
+    if max_points < 2:
+        raise ValueError(f"max_points must be 2 or more not {max_points}")
+
+    if trim_zeros:
+        spectrum = spectrum.trim_zeros()
+
+    x = spectrum.energy_bin_starts
+    y = spectrum.values
+    y_err = spectrum.std_dev
+
+    # includes the bin that energy_min falls within as it is partly visible
+    start = 0
+    end = len(y)
+    if energy_min is not None:
+        start = max(int(np.searchsorted(x, energy_min, side="right")) - 1, 0)
+    if energy_max is not None:
+        # one more point is included so the "hv" step of the last visible bin
+        # is drawn across to the start of the next bin
+        end = min(int(np.searchsorted(x, energy_max, side="right")) + 1, len(y))
+
+    x = x[start:end]
+    y = y[start:end]
+    if y_err is not None:
+        y_err = y_err[start:end]
+
+    if len(y) <= max_points:
+        result = {"x": x.tolist(), "y": y.tolist(), "decimated": False}
+        if y_err is not None:
+            result["y_err"] = y_err.tolist()
+        return result
+
+    # each group of bins is represented by its maximum and minimum bins
+    number_of_groups = max_points // 2
+    group_starts = np.linspace(0, len(y), number_of_groups, endpoint=False).astype(int)
+    group_sizes = np.diff(np.append(group_starts, len(y)))
+    group_ids = np.repeat(np.arange(number_of_groups), group_sizes)
+
+    group_max = np.maximum.reduceat(y, group_starts)
+    group_min = np.minimum.reduceat(y, group_starts)
+
+    # the first bin in each group that equals the group maximum or minimum
+    max_indices = first_index_in_groups(y == group_max[group_ids], group_ids)
+    min_indices = first_index_in_groups(y == group_min[group_ids], group_ids)
+
+    # the two points of each group are kept in energy order
+    indices = np.sort(np.column_stack((max_indices, min_indices)), axis=1).ravel()
+
+    result = {
+        "x": x[indices].tolist(),
+        "y": y[indices].tolist(),
+        "decimated": True,
+    }
+    if y_err is not None:
+        result["y_err"] = y_err[indices].tolist()
+
+    return result
+
+
+def first_index_in_groups(mask: np.ndarray, group_ids: np.ndarray) -> np.ndarray:
+    """Returns the index of the first True value of the mask within each group.
+    Every group must contain at least one True value"""
+
+    true_indices = np.flatnonzero(mask)
+    _, first = np.unique(group_ids[true_indices], return_index=True)
+    return true_indices[first]
+
+
+def create_dashboard_app(
+    spectrum: Union[dict, SpectrumSet],
+    x_label: Optional[str] = "",
+    y_label: Optional[str] = "",
+    x_scale: Optional[str] = "linear",
+    y_scale: Optional[str] = "linear",
+    title: Optional[str] = "",
+    max_points: int = 2000,
+    required_units: str = "centimeters / source_particle",
+    required_energy_units: str = "eV",
+    source_strength: float = None,
+    volume: float = None,
+):
+    """Creates an ASGI app for browsing many spectra in a web browser. The
+    app works offline as plotly.js is served by the app. A decimated overview
+    of each spectrum is sent first and the full resolution step data is
+    fetched for the visible energy range when zooming in. The log and lin
+    axis selection is remembered by the browser across reloads.
+
+    Arguments:
+        spectrum: A dictionary where the key is the spectrum title and the
+            dictionary values are openmc.Tally objects, Spectrum objects or
+            tuples of x, y and optionally y_error values. A SpectrumSet can
+            be passed in place of the dictionary.
+        x_label: the label to use on the x axis,
+        y_label: the label to use on the y axis,
+        x_scale: the scale to use for the x axis. Options are 'linear', 'log'
+        y_scale: the scale to use for the y axis. Options are 'linear', 'log'
+        title: the title applied to the top of the plot
+        max_points: the maximum number of points sent to the browser for
+            each spectrum.
+        required_units: The units desired for the Y axis of tallies.
+        required_energy_units: The units desired for the X axis of tallies.
+        source_strength: The strength of the source which is to be used for
+            source normalization of tallies.
+        volume: The volume which is to be used for volume normalisation of
+            tallies.
+
+    Returns:
+        the ASGI app which can be served with an ASGI server such as uvicorn
+    """
+
+    cache = SpectrumCache(
+        spectrum=spectrum,
+        required_units=required_units,
+        required_energy_units=required_energy_units,
+        source_strength=source_strength,
+        volume=volume,
+    )
+
+    figure = add_axis_title_labels(
+        x_label=x_label,
+        y_label=y_label,
+        y_scale=y_scale,
+        x_scale=x_scale,
+        title=title,
+        legend=True,
+        plotting_package="plotly",
+    )
+    page = DASHBOARD_PAGE.replace(
+        "{{layout}}", to_html_safe_json(figure.layout.to_plotly_json())
+    )
+
+    def handle_request(path: str, query: Dict[str, list]) -> Tuple[int, str, bytes]:
+        if path == "/":
+            return 200, "text/html; charset=utf-8", page.encode()
+
+        if path == "/plotly.min.js":
+            return 200, "application/javascript", get_plotlyjs().encode()
+
+        if path == "/spectra":
+            return 200, "application/json", json.dumps(list(cache.keys())).encode()
+
+        if path.startswith("/spectra/"):
+            key = path[len("/spectra/") :]
+            if key not in cache:
+                return 404, "text/plain", b"spectrum not found"
+
+            energy_min = query.get("energy_min", [None])[0]
+            energy_max = query.get("energy_max", [None])[0]
+            try:
+                if energy_min is None and energy_max is None:
+                    data = cache.get_overview(key, max_points)
+                else:
+                    data = decimate_spectrum(
+                        cache[key],
+                        energy_min=None if energy_min is None else float(energy_min),
+                        energy_max=None if energy_max is None else float(energy_max),
+                        max_points=max_points,
+                    )
+            except ValueError as error:
+                return 400, "text/plain", str(error).encode()
+
+            return 200, "application/json", json.dumps(data).encode()
+
+        return 404, "text/plain", b"not found"
+
+    async def app(scope, receive, send):
+        if scope["type"] == "lifespan":
+            while True:
+                message = await receive()
+                if message["type"] == "lifespan.startup":
+                    await send({"type": "lifespan.startup.complete"})
+                elif message["type"] == "lifespan.shutdown":
+                    await send({"type": "lifespan.shutdown.complete"})
+                    return
+
+        if scope["type"] != "http":
+            return
+
+        query = parse_qs(scope.get("query_string", b"").decode())
+        status, content_type, body = handle_request(scope["path"], query)
+
+        await send(
+            {
+                "type": "http.response.start",
+                "status": status,
+                "headers": [(b"content-type", content_type.encode())],
+            }
+        )
+        await send({"type": "http.response.body", "body": body})
+
+    return app
+
+
+def run_dashboard(
+    spectrum: Union[dict, SpectrumSet],
+    host: str = "127.0.0.1",
+    port: int = 8050,
+    **kwargs,
+):
+    """Serves the dashboard created by create_dashboard_app with uvicorn.
+    Requires the uvicorn package which can be installed with
+    pip install uvicorn
+
+    Arguments:
+        spectrum: the spectra to serve, see create_dashboard_app.
+        host: the address to serve the dashboard on.
+        port: the port to serve the dashboard on.
+        kwargs: other arguments passed to create_dashboard_app.
+    """
+
+    try:
+        import uvicorn
+    except ImportError as error:
+        msg = "run_dashboard requires uvicorn, install it with pip install uvicorn"
+        raise ImportError(msg) from error
+
+    app = create_dashboard_app(spectrum=spectrum, **kwargs)
+    uvicorn.run(app, host=host, port=port)
@@ -0,0 +1,225 @@
+from collections.abc import Mapping
+from typing import Dict, Iterator, Optional, Tuple, Union
+
+import numpy as np
+from numpy import ndarray
+
+# the dtype used for all spectrum arrays
+SPECTRUM_DTYPE = np.float64
+
+
+class Spectrum:
+    """A single spectrum made from energy values, tally values and optional
+    standard deviation values along with their units and any metadata.
+
+    The arrays are stored as contiguous read-only float64 views so a Spectrum
+    can be shared between plots without defensive copies. Pickling with
+    protocol 5 passes the arrays as out-of-band buffers, which allows a
+    Spectrum to be sent to worker processes without copying the data.
+
+    Arguments:
+        energy: the energy values. Either the start of each energy bin (the
+            same length as values) or the energy bin edges (one longer than
+            values) as produced by an openmc.EnergyFilter.
+        values: the tally values for each energy bin.
+        std_dev: optional standard deviation values for each energy bin.
+        energy_units: the units of the energy values e.g. "eV". Found from
+            the energy if it is a Pint Quantity and not provided.
+        units: the units of the values e.g. "centimeters / source_particle".
+            Found from the values if they are a Pint Quantity and not provided.
+        metadata: a dictionary of any other information about the spectrum.
+    """
+
+    __slots__ = ("energy", "values", "std_dev", "energy_units", "units", "metadata")
+
+    def __init__(
+        self,
+        energy: ndarray,
+        values: ndarray,
+        std_dev: Optional[ndarray] = None,
+        energy_units: Optional[str] = None,
+        units: Optional[str] = None,
+        metadata: Optional[dict] = None,
+    ):
+        if energy_units is None:
+            energy_units = get_units(energy)
+        if units is None:
+            units = get_units(values)
+
+        self.energy = to_read_only_array(energy)
+        self.values = to_read_only_array(values)
+        if std_dev is None:
+            self.std_dev = None
+        else:
+            self.std_dev = to_read_only_array(std_dev)
+        self.energy_units = energy_units
+        self.units = units
+        if metadata is None:
+            metadata = {}
+        self.metadata = metadata
+
+        if len(self.energy) not in (len(self.values), len(self.values) + 1):
+            msg = (
+                "energy must be the same length as values or one longer "
+                f"when energy bin edges are used. energy has length "
+                f"{len(self.energy)} and values has length {len(self.values)}"
+            )
+            raise ValueError(msg)
+
+        if self.std_dev is not None and len(self.std_dev) != len(self.values):
+            msg = (
+                f"std_dev must be the same length as values. std_dev has "
+                f"length {len(self.std_dev)} and values has length "
+                f"{len(self.values)}"
+            )
+            raise ValueError(msg)
+
+    def __reduce__(self):
+        # numpy pickles the arrays as out-of-band buffers for protocol 5
+        return (
+            self.__class__,
+            (
+                self.energy,
+                self.values,
+                self.std_dev,
+                self.energy_units,
+                self.units,
+                self.metadata,
+            ),
+        )
+
+    def __repr__(self):
+        return (
+            f"Spectrum(number_of_bins={len(self.values)}, "
+            f"energy_units={self.energy_units!r}, units={self.units!r}, "
+            f"has_std_dev={self.has_std_dev})"
+        )
+
+    def __len__(self):
+        return len(self.values)
+
+    @property
+    def has_std_dev(self) -> bool:
+        """True if standard deviation values are included"""
+        return self.std_dev is not None
+
+    @property
+    def energy_is_bin_edges(self) -> bool:
+        """True if the energy values are energy bin edges rather than the
+        start of each energy bin"""
+        return len(self.energy) == len(self.values) + 1
+
+    @property
+    def energy_bin_starts(self) -> ndarray:
+        """The start of each energy bin, the same length as values"""
+        return self.energy[: len(self.values)]
+
+    def trim_zeros(self) -> "Spectrum":
+        """Returns a Spectrum with the zero values at the high energy end
+        removed. The arrays of the returned Spectrum are views of this one"""
+
+        nonzero = np.flatnonzero(self.values)
+        if len(nonzero) == 0:
+            number_of_bins = 0
+        else:
+            number_of_bins = nonzero[-1] + 1
+
+        if number_of_bins == len(self.values):
+            return self
+
+        if self.energy_is_bin_edges:
+            energy = self.energy[: number_of_bins + 1]
+        else:
+            energy = self.energy[:number_of_bins]
+
+        if self.has_std_dev:
+            std_dev = self.std_dev[:number_of_bins]
+        else:
+            std_dev = None
+
+        return Spectrum(
+            energy=energy,
+            values=self.values[:number_of_bins],
+            std_dev=std_dev,
+            energy_units=self.energy_units,
+            units=self.units,
+            metadata=self.metadata,
+        )
+
+    def to_tuple(self) -> Tuple[ndarray, ...]:
+        """Returns the energy, values and std_dev (when present) as a tuple"""
+        if self.has_std_dev:
+            return (self.energy, self.values, self.std_dev)
+        return (self.energy, self.values)
+
+
+class SpectrumSet(Mapping):
+    """An ordered, read-only collection of Spectrum objects keyed by the
+    spectrum title. Can be passed to plot_spectrum_from_values and
+    plot_spectrum_from_tally in place of a dictionary.
+
+    Arguments:
+        spectra: A dictionary where the key is the spectrum title and the
+            dictionary values are Spectrum objects or tuples containing x, y
+            and optionally y_error values.
+    """
+
+    __slots__ = ("_spectra",)
+
+    def __init__(
+        self, spectra: Optional[Dict[str, Union[Spectrum, Tuple[ndarray, ...]]]] = None
+    ):
+        if spectra is None:
+            spectra = {}
+        self._spectra = {key: to_spectrum(value) for key, value in spectra.items()}
+
+    def __getitem__(self, key: str) -> Spectrum:
+        return self._spectra[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._spectra)
+
+    def __len__(self) -> int:
+        return len(self._spectra)
+
+    def __reduce__(self):
+        return (self.__class__, (self._spectra,))
+
+    def __repr__(self):
+        return f"SpectrumSet({list(self._spectra)!r})"
+
+
+def to_spectrum(spectrum: Union[Spectrum, Tuple[ndarray, ...]]) -> Spectrum:
+    """Returns a Spectrum from a tuple of x, y and optionally y_error values.
+    Spectrum objects are returned unchanged"""
+
+    if isinstance(spectrum, Spectrum):
+        return spectrum
+
+    if len(spectrum) not in (2, 3):
+        msg = (
+            "spectrum values must contain x and y values and optionally "
+            f"y_error values not {len(spectrum)} items"
+        )
+        raise ValueError(msg)
+
+    return Spectrum(*spectrum)
+
+
+def to_read_only_array(values) -> ndarray:
+    """Returns a contiguous read-only float64 view of the values. A copy is
+    only made if the values are not already a contiguous float64 array"""
+
+    array = np.ascontiguousarray(getattr(values, "magnitude", values), SPECTRUM_DTYPE)
+    view = array.view()
+    view.flags.writeable = False
+    return view
+
+
+def get_units(values) -> Optional[str]:
+    """Returns the units of a Pint Quantity or None for other objects"""
+
+    units = getattr(values, "units", None)
+    if units is None:
+        return None
+    return str(units)
@@ -0,0 +1,139 @@
+import unittest
+
+from spectrum_plotter import (
+    Spectrum,
+    add_analysis_annotations,
+    analyse_spectra,
+    plot_spectrum_from_values,
+)
+from spectrum_plotter import plot_spectrum_grid_from_values
+from spectrum_plotter.analysis import group_by_energy_grid
+import numpy as np
+import matplotlib
+import plotly.graph_objects as go
+
+
+class TestAnalyseSpectra(unittest.TestCase):
+    def setUp(self):
+
+        # energy bin edges in eV with a bin containing 14.1 MeV
+        self.x = np.array([0, 1e6, 2e6, 5e6, 10e6, 13e6, 14e6, 15e6, 16e6, 20e6])
+        self.y = np.array([1, 1, 1, 1, 1, 1, 10, 1, 1])
+        self.y_flat = np.ones(9)
+
+        self.spectrum = {
+            "peaked": (self.x, self.y),
+            "flat": Spectrum(self.x, self.y_flat),
+            "other grid": (np.array([1, 2, 3]), np.array([1, 3, 0])),
+        }
+
+    def test_summary_quantities(self):
+
+        analysis = analyse_spectra(self.spectrum, threshold_energy=14e6)
+
+        assert list(analysis) == ["peaked", "flat", "other grid"]
+        assert analysis["peaked"]["total"] == 18
+        assert analysis["peaked"]["fraction_above_threshold"] == 12 / 18
+        assert analysis["flat"]["fraction_above_threshold"] == 3 / 9
+
+        midpoints = (self.x[:-1] + self.x[1:]) / 2
+        assert np.isclose(analysis["flat"]["mean_energy"], midpoints.mean())
+
+        # energy bin starts are treated as bins with the previous width
+        assert analysis["other grid"]["mean_energy"] == (1.5 + 3 * 2.5) / 4
+
+    def test_peaks(self):
+
+        analysis = analyse_spectra(self.spectrum)
+
+        assert analysis["peaked"]["peaks"] == {"DT": 14.1e6}
+        assert analysis["flat"]["peaks"] == {}
+
+        analysis = analyse_spectra(self.spectrum, peaks={"custom": 1.5e6})
+        assert analysis["peaked"]["peaks"] == {}
+
+    def test_spectra_are_grouped_by_energy_grid(self):
+
+        groups = group_by_energy_grid(self.spectrum)
+        assert [len(group) for group in groups] == [2, 1]
+
+        # equal energy grids from different arrays are also grouped
+        groups = group_by_energy_grid(
+            {"a": (self.x, self.y), "b": (self.x.copy(), self.y)}
+        )
+        assert len(groups) == 1
+
+    def test_energy_units(self):
+
+        spectrum = {
+            "MeV": Spectrum(self.x / 1e6, self.y, energy_units="MeV"),
+            "eV": Spectrum(self.x, self.y, energy_units="eV"),
+        }
+
+        analysis = analyse_spectra(spectrum, threshold_energy=14e6)
+
+        assert analysis["MeV"]["peaks"] == {"DT": 14.1}
+        assert analysis["MeV"]["fraction_above_threshold"] == 12 / 18
+        assert analysis["MeV"]["threshold_energy"] == 14
+        assert analysis["MeV"]["energy_units"] == "MeV"
+        assert np.isclose(
+            analysis["MeV"]["mean_energy"] * 1e6, analysis["eV"]["mean_energy"]
+        )
+
+        with self.assertRaises(ValueError):
+            analyse_spectra({"J": Spectrum(self.x, self.y, energy_units="joule")})
+
+    def test_empty_spectrum(self):
+
+        analysis = analyse_spectra({"empty": (np.array([1.0]), np.array([]))})
+
+        assert analysis["empty"]["total"] == 0
+        assert np.isnan(analysis["empty"]["fraction_above_threshold"])
+        assert np.isnan(analysis["empty"]["mean_energy"])
+        assert analysis["empty"]["peaks"] == {}
+
+    def test_add_analysis_annotations(self):
+
+        analysis = analyse_spectra(self.spectrum)
+
+        test_plot = plot_spectrum_from_values(spectrum=self.spectrum)
+        test_plot = add_analysis_annotations(test_plot, analysis, "matplotlib")
+        assert isinstance(test_plot, type(matplotlib.pyplot))
+
+        test_plot = plot_spectrum_from_values(
+            spectrum=self.spectrum, plotting_package="plotly"
+        )
+        number_of_traces = len(test_plot.data)
+        test_plot = add_analysis_annotations(test_plot, analysis, "plotly")
+        assert isinstance(test_plot, go.Figure)
+        assert len(test_plot.data) == number_of_traces + 1
+        assert test_plot.data[-1].name == "DT"
+        # one summary for each set of axes
+        assert len(test_plot.layout.annotations) == 1
+        assert "peaked<br>total 18" in test_plot.layout.annotations[0].text
+
+    def test_add_analysis_annotations_to_grid(self):
+
+        analysis = analyse_spectra(self.spectrum)
+
+        test_plot = plot_spectrum_grid_from_values(spectrum=self.spectrum)
+        add_analysis_annotations(test_plot, analysis, "matplotlib")
+        # the peaked panel has the peak line and every panel has a summary
+        assert len(test_plot.axes[0].lines) == 2
+        assert len(test_plot.axes[1].lines) == 1
+        assert all(len(axis.texts) >= 1 for axis in test_plot.axes)
+
+        test_plot = plot_spectrum_grid_from_values(
+            spectrum=self.spectrum, plotting_package="plotly"
+        )
+        number_of_annotations = len(test_plot.layout.annotations)
+        add_analysis_annotations(test_plot, analysis, "plotly")
+        assert test_plot.data[-1].xaxis == "x"
+        assert test_plot.layout.yaxis100.overlaying == "y"
+        assert len(test_plot.layout.annotations) == number_of_annotations + 3
+        assert test_plot.layout.annotations[-1].xref == "x3 domain"
+
+    def test_incorrect_plotting_package(self):
+
+        with self.assertRaises(ValueError):
+            add_analysis_annotations(None, {}, "bokeh")
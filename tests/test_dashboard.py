@@ -0,0 +1,116 @@
+import asyncio
+import json
+import unittest
+
+from spectrum_plotter import Spectrum, create_dashboard_app, decimate_spectrum
+import numpy as np
+
+
+def get(app, path, query_string=b""):
+    """Sends a GET request to the ASGI app and returns the status and body.
+    The path is percent-decoded as it would be by an ASGI server"""
+
+    messages = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        messages.append(message)
+
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "path": path,
+        "query_string": query_string,
+    }
+    asyncio.run(app(scope, receive, send))
+
+    return messages[0]["status"], messages[1]["body"]
+
+
+class TestDashboard(unittest.TestCase):
+    def setUp(self):
+
+        self.x = np.logspace(0, 7, 10001)
+        self.y = np.ones(10000)
+        self.y[5000] = 100.0
+
+        self.spectrum = Spectrum(self.x, self.y, self.y * 0.1)
+
+    def test_decimate_spectrum_keeps_peaks(self):
+
+        data = decimate_spectrum(self.spectrum, max_points=200)
+
+        assert data["decimated"]
+        assert len(data["x"]) <= 200
+        assert len(data["y_err"]) == len(data["y"])
+        assert max(data["y"]) == 100.0
+        assert min(data["y"]) == 1.0
+
+        # the peak is kept at the energy of its bin and points stay in order
+        assert data["x"][data["y"].index(100.0)] == self.x[5000]
+        assert data["x"] == sorted(data["x"])
+
+    def test_decimate_spectrum_energy_range(self):
+
+        energy_min = self.x[100]
+        energy_max = self.x[150]
+
+        data = decimate_spectrum(
+            self.spectrum, energy_min=energy_min, energy_max=energy_max
+        )
+
+        # full resolution is returned when zoomed into a small energy range
+        assert not data["decimated"]
+        assert data["x"] == self.x[100:152].tolist()
+
+    def test_decimate_spectrum_zoom_inside_one_bin(self):
+
+        spectrum = Spectrum(np.array([0, 10, 20, 30]), np.array([1, 2, 3]))
+
+        # the start of the next bin is needed to draw the step of the bin
+        data = decimate_spectrum(spectrum, energy_min=12, energy_max=18)
+        assert data["x"] == [10.0, 20.0]
+        assert data["y"] == [2.0, 3.0]
+
+        data = decimate_spectrum(spectrum, energy_min=5, energy_max=15)
+        assert data["x"] == [0.0, 10.0, 20.0]
+
+    def test_decimate_spectrum_incorrect_max_points(self):
+
+        with self.assertRaises(ValueError):
+            decimate_spectrum(self.spectrum, max_points=1)
+
+    def test_dashboard_app(self):
+
+        app = create_dashboard_app(
+            spectrum={"test plot 1": self.spectrum, "test/plot 2": (self.x, self.y)},
+            x_scale="log",
+            title="</script><b>title</b>",
+            max_points=100,
+        )
+
+        status, body = get(app, "/")
+        assert status == 200
+        assert b"/plotly.min.js" in body
+        assert b"{{layout}}" not in body
+        # the title can not close the script tag containing the layout
+        assert body.count(b"</script>") == 2
+
+        status, body = get(app, "/plotly.min.js")
+        assert status == 200
+
+        status, body = get(app, "/spectra")
+        assert json.loads(body) == ["test plot 1", "test/plot 2"]
+
+        status, body = get(app, "/spectra/test/plot 2")
+        assert status == 200
+        assert len(json.loads(body)["x"]) <= 100
+
+        status, body = get(app, "/spectra/test plot 1", b"energy_min=10&energy_max=11")
+        assert status == 200
+        assert not json.loads(body)["decimated"]
+
+        status, body = get(app, "/spectra/missing")
+        assert status == 404
@@ -0,0 +1,86 @@
+import os
+import unittest
+from pathlib import Path
+from spectrum_plotter import plot_spectrum_grid_from_values
+import numpy as np
+import matplotlib
+import matplotlib.pyplot as plt
+import plotly.graph_objects as go
+
+
+class TestPlotSpectrumGrid(unittest.TestCase):
+    def setUp(self):
+
+        x1 = np.array([1, 2, 3, 4, 5, 6])
+        y1 = np.array([0, 1, 1, 0.5, 0.4, 3])
+        y_err1 = np.array([0.2, 0.1, 0.4, 0.1, 0.1, 0.2])
+
+        self.spectrum_5 = {f"test plot {i}": (x1, y1) for i in range(5)}
+        self.spectrum_5_with_error = {
+            f"test plot {i}": (x1, y1, y_err1) for i in range(5)
+        }
+
+    def test_plot_grid_from_values_matplotlib(self):
+
+        test_plot = plot_spectrum_grid_from_values(spectrum=self.spectrum_5, columns=2)
+
+        assert isinstance(test_plot, matplotlib.figure.Figure)
+        # one panel per spectrum, the unused sixth panel is removed
+        assert len(test_plot.axes) == 5
+
+    def test_plot_grid_from_values_with_error_matplotlib(self):
+
+        test_plot = plot_spectrum_grid_from_values(
+            spectrum=self.spectrum_5_with_error, x_scale="log", y_scale="log"
+        )
+
+        assert isinstance(test_plot, matplotlib.figure.Figure)
+        assert test_plot.axes[0].get_xscale() == "log"
+
+    def test_plot_grid_from_values_plotly(self):
+
+        test_plot = plot_spectrum_grid_from_values(
+            spectrum=self.spectrum_5_with_error,
+            x_label="E",
+            columns=3,
+            plotting_package="plotly",
+        )
+
+        assert isinstance(test_plot, go.Figure)
+        # each spectrum with errors adds upper, lower and result traces
+        assert len(test_plot.data) == 15
+        assert test_plot.data[-1].xaxis == "x5"
+        # the third panel has no panel below it so has its own x tick labels
+        assert test_plot.layout.xaxis3.showticklabels
+        assert test_plot.layout.xaxis3.title.text == "E"
+        assert test_plot.layout.xaxis5.title.text == "E"
+        assert test_plot.layout.xaxis.showticklabels is False
+        assert test_plot.layout.xaxis.title.text is None
+        # the sixth cell is unused and hidden
+        assert test_plot.layout.xaxis6.visible is False
+        assert test_plot.layout.yaxis6.visible is False
+
+    def test_plot_grid_saves_single_file(self):
+
+        plot_spectrum_grid_from_values(
+            spectrum=self.spectrum_5,
+            plotting_package="plotly",
+            filename="test_grid.html",
+        )
+
+        assert Path("test_grid.html").is_file()
+        os.remove("test_grid.html")
+
+    def test_plot_grid_does_not_leave_figures_open(self):
+
+        number_of_figures = len(plt.get_fignums())
+
+        for _ in range(25):
+            plot_spectrum_grid_from_values(spectrum=self.spectrum_5)
+
+        assert len(plt.get_fignums()) == number_of_figures
+
+    def test_incorrect_columns(self):
+
+        with self.assertRaises(ValueError):
+            plot_spectrum_grid_from_values(spectrum=self.spectrum_5, columns=0)
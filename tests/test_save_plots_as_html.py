@@ -0,0 +1,82 @@
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from spectrum_plotter import plot_spectrum_from_values, save_plots_as_html_bundle
+import numpy as np
+
+
+class TestSavePlotsAsHtml(unittest.TestCase):
+    def setUp(self):
+
+        x1 = np.array([1, 2, 3, 4, 5, 6])
+        y1 = np.array([0, 1, 1, 0.5, 0.4, 3])
+        y_err1 = np.array([0.2, 0.1, 0.4, 0.1, 0.1, 0.2])
+
+        self.spectrum_with_error = {"test plot_1": (x1, y1, y_err1)}
+        self.output_dir = tempfile.mkdtemp()
+
+    def test_html_plotlyjs_directory_writes_shared_plotlyjs(self):
+
+        for number in range(3):
+            plot_spectrum_from_values(
+                spectrum=self.spectrum_with_error,
+                plotting_package="plotly",
+                filename=os.path.join(self.output_dir, f"plot_{number}.html"),
+                html_plotlyjs="directory",
+            )
+
+        plotlyjs = Path(self.output_dir) / "plotly.min.js"
+        assert plotlyjs.is_file()
+        for number in range(3):
+            html_file = Path(self.output_dir) / f"plot_{number}.html"
+            # the html file references plotly.js rather than embedding it
+            assert html_file.stat().st_size < plotlyjs.stat().st_size / 10
+            assert 'src="plotly.min.js"' in html_file.read_text()
+
+    def test_incorrect_html_plotlyjs(self):
+
+        with self.assertRaises(ValueError):
+            plot_spectrum_from_values(
+                spectrum=self.spectrum_with_error,
+                plotting_package="plotly",
+                filename=os.path.join(self.output_dir, "plot.html"),
+                html_plotlyjs="cdn",
+            )
+
+    def test_save_plots_as_html_bundle(self):
+
+        figures = {}
+        for number in range(3):
+            figures[f"plot {number}"] = plot_spectrum_from_values(
+                spectrum=self.spectrum_with_error, plotting_package="plotly"
+            )
+
+        filename = os.path.join(self.output_dir, "bundle.html")
+        save_plots_as_html_bundle(figures=figures, filename=filename)
+
+        assert (Path(self.output_dir) / "plotly.min.js").is_file()
+        html_text = Path(filename).read_text()
+        assert html_text.count('class="spectrum-plot"') == 3
+        assert 'src="plotly.min.js"' in html_text
+        assert "<h2>plot 2</h2>" in html_text
+
+    def test_save_plots_as_html_bundle_shares_template(self):
+
+        def figures():
+            for number in range(5):
+                figure = plot_spectrum_from_values(
+                    spectrum=self.spectrum_with_error, plotting_package="plotly"
+                )
+                yield f"plot {number}", figure
+
+        filename = os.path.join(self.output_dir, "bundle.html")
+        save_plots_as_html_bundle(figures=figures(), filename=filename)
+
+        html_text = Path(filename).read_text()
+        assert html_text.count('class="spectrum-plot"') == 5
+        # the default template is written once and referenced by every figure
+        assert html_text.count('id="spectrum-template-') == 1
+        assert html_text.count('data-template="spectrum-template-0"') == 5
+        assert html_text.count('"template"') == 0
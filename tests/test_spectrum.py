@@ -0,0 +1,161 @@
+import pickle
+import unittest
+
+from spectrum_plotter import (
+    Spectrum,
+    SpectrumSet,
+    plot_spectrum_from_tally,
+    plot_spectrum_from_values,
+)
+import numpy as np
+import matplotlib
+import plotly.graph_objects as go
+
+
+class TestSpectrum(unittest.TestCase):
+    def setUp(self):
+
+        self.x = np.array([1, 2, 3, 4, 5, 6])
+        self.y = np.array([0, 1, 1, 0.5, 0, 0])
+        self.y_err = np.array([0.2, 0.1, 0.4, 0.1, 0.1, 0.2])
+
+        self.spectrum = Spectrum(
+            self.x, self.y, self.y_err, energy_units="MeV", units="n/cm^2s"
+        )
+
+    def test_arrays_are_contiguous_read_only_float64(self):
+
+        for array in [self.spectrum.energy, self.spectrum.values]:
+            assert array.dtype == np.float64
+            assert array.flags.c_contiguous
+            assert not array.flags.writeable
+
+    def test_float64_arrays_are_not_copied(self):
+
+        values = np.array([1.0, 2.0, 3.0])
+        spectrum = Spectrum(np.array([1.0, 2.0, 3.0]), values)
+
+        assert np.shares_memory(spectrum.values, values)
+        # the caller's array remains writeable
+        assert values.flags.writeable
+
+    def test_slots(self):
+
+        with self.assertRaises(AttributeError):
+            self.spectrum.new_attribute = 1
+
+    def test_energy_bin_edges(self):
+
+        spectrum = Spectrum(np.array([0, 1, 2, 3]), np.array([1, 2, 3]))
+
+        assert spectrum.energy_is_bin_edges
+        assert not self.spectrum.energy_is_bin_edges
+        assert len(spectrum.energy_bin_starts) == 3
+
+    def test_incorrect_lengths(self):
+
+        with self.assertRaises(ValueError):
+            Spectrum(np.array([1, 2]), np.array([1, 2, 3, 4]))
+
+        with self.assertRaises(ValueError):
+            Spectrum(self.x, self.y, np.array([0.1]))
+
+    def test_trim_zeros(self):
+
+        trimmed = self.spectrum.trim_zeros()
+
+        assert len(trimmed) == 4
+        assert len(trimmed.energy) == 4
+        assert len(trimmed.std_dev) == 4
+        assert trimmed.units == "n/cm^2s"
+        assert np.shares_memory(trimmed.values, self.spectrum.values)
+
+    def test_pickle_protocol_5_out_of_band(self):
+
+        buffers = []
+        data = pickle.dumps(self.spectrum, protocol=5, buffer_callback=buffers.append)
+        spectrum = pickle.loads(data, buffers=buffers)
+
+        # energy, values and std_dev are all passed as out-of-band buffers
+        assert len(buffers) == 3
+        assert np.array_equal(spectrum.values, self.spectrum.values)
+        assert np.array_equal(spectrum.std_dev, self.spectrum.std_dev)
+        assert spectrum.energy_units == "MeV"
+
+    def test_spectrum_set_pickle(self):
+
+        spectra = SpectrumSet({"test plot 1": self.spectrum})
+        spectra = pickle.loads(pickle.dumps(spectra, protocol=5))
+
+        assert list(spectra) == ["test plot 1"]
+        assert spectra["test plot 1"].units == "n/cm^2s"
+
+    def test_spectrum_set_from_tuples(self):
+
+        spectra = SpectrumSet({"test plot 1": (self.x, self.y)})
+
+        assert isinstance(spectra["test plot 1"], Spectrum)
+        assert not spectra["test plot 1"].has_std_dev
+
+    def test_plot_spectrum_set_from_values(self):
+
+        spectra = SpectrumSet(
+            {"test plot 1": self.spectrum, "test plot 2": (self.x, self.y)}
+        )
+
+        test_plot = plot_spectrum_from_values(spectrum=spectra)
+        assert isinstance(test_plot, type(matplotlib.pyplot))
+
+        test_plot = plot_spectrum_from_values(
+            spectrum=spectra, plotting_package="plotly"
+        )
+        assert isinstance(test_plot, go.Figure)
+        # trailing zeros are trimmed from the plotted values
+        assert len(test_plot.data[-1].y) == 4
+
+    def test_plot_spectrum_set_from_tally(self):
+
+        spectra = SpectrumSet({"test plot 1": self.spectrum})
+
+        test_plot = plot_spectrum_from_tally(
+            spectrum=spectra,
+            plotting_package="plotly",
+            required_units="n/cm^2s",
+            required_energy_units="MeV",
+        )
+        assert isinstance(test_plot, go.Figure)
+
+    def test_plot_spectrum_set_from_tally_positional_units(self):
+
+        spectra = SpectrumSet({"test plot 1": self.spectrum})
+
+        # the units keep their original positions in the signature
+        test_plot = plot_spectrum_from_tally(
+            spectra,
+            "",
+            "",
+            "linear",
+            "linear",
+            "",
+            True,
+            None,
+            "plotly",
+            True,
+            "n/cm^2s",
+            "MeV",
+        )
+        assert isinstance(test_plot, go.Figure)
+
+    def test_plot_spectrum_set_from_tally_incorrect_units(self):
+
+        spectra = SpectrumSet({"test plot 1": self.spectrum})
+
+        with self.assertRaises(ValueError):
+            plot_spectrum_from_tally(spectrum=spectra, required_energy_units="MeV")
+
+        with self.assertRaises(ValueError):
+            plot_spectrum_from_tally(spectrum=spectra, required_units="n/cm^2s")
+
+        # spectra without units are assumed to be in the required units
+        spectra = SpectrumSet({"test plot 1": (self.x, self.y)})
+        plot_spectrum_from_tally(spectrum=spectra)